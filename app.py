@@ -1,24 +1,49 @@
 from flask import Flask, request
-from datetime import date, datetime
-import re
+import numpy as np
+from datetime import date
+import bisect
+import sys
 import unicodedata
-from helpers import rest_response, rest_error
+from typing import NamedTuple
+from functools import lru_cache
+from urllib.parse import parse_qsl
+from helpers import rest_response, rest_error, rest_response_body, rest_prepared
 
+# orjson handles serialization (see helpers): UTF-8 output and insertion
+# order come for free, so no JSON config is needed on the app.
 app = Flask(__name__)
-app.config["JSON_AS_ASCII"] = False
-app.config["JSON_SORT_KEYS"] = False  # preserve field order
+
+class EraRecord(NamedTuple):
+    """One era, with its start date precomputed in every form the hot
+    paths need. Attribute access specializes well under CPython 3.12+."""
+    code: str
+    en: str
+    ja: str
+    start: tuple
+    start_date: date
+    start_str: str
 
 # Era start dates (inclusive), newest first
 # Reiwa: 2019-05-01, Heisei: 1989-01-08, Showa: 1926-12-25, Taisho: 1912-07-30, Meiji: 1868-01-25
 ERAS = [
-    ("R", "Reiwa",  "令和",  (2019, 5, 1)),
-    ("H", "Heisei", "平成",  (1989, 1, 8)),
-    ("S", "Showa",  "昭和",  (1926, 12, 25)),
-    ("T", "Taisho", "大正",  (1912, 7, 30)),
-    ("M", "Meiji",  "明治",  (1868, 1, 25)),
+    EraRecord(sys.intern(code), sys.intern(en), sys.intern(ja), start,
+              date(*start), "{:04d}-{:02d}-{:02d}".format(*start))
+    for code, en, ja, start in [
+        ("R", "Reiwa",  "令和",  (2019, 5, 1)),
+        ("H", "Heisei", "平成",  (1989, 1, 8)),
+        ("S", "Showa",  "昭和",  (1926, 12, 25)),
+        ("T", "Taisho", "大正",  (1912, 7, 30)),
+        ("M", "Meiji",  "明治",  (1868, 1, 25)),
+    ]
 ]
 MIN_YEAR = 1868
 
+# Ascending views for bisect-based era selection.
+_ERAS_ASC = list(reversed(ERAS))
+_ERA_START_YEARS = [e.start[0] for e in _ERAS_ASC]
+_ERA_START_DATES = [e.start_date for e in _ERAS_ASC]
+_ERA_START_YEARS_NP = np.array(_ERA_START_YEARS, dtype=np.int32)
+
 # Accept codes, romaji, kana, and kanji
 ERA_ALIASES = {
     "r": "R", "reiwa": "R", "れいわ": "R", "令和": "R",
@@ -28,31 +53,84 @@ ERA_ALIASES = {
     "m": "M", "meiji": "M", "めいじ": "M", "明治": "M",
 }
 
+# Fold table covering the transforms this app actually needs: full-width
+# digits → ASCII, ideographic space → space, and the macron/circumflex
+# vowels seen in romaji era names. Full NFKC stays as the fallback.
+_FOLD = str.maketrans(
+    {chr(ord("０") + i): chr(ord("0") + i) for i in range(10)}
+    | {"ō": "o", "ū": "u", "ā": "a", "ē": "e", "ī": "i",
+       "â": "a", "ê": "e", "î": "i", "ô": "o", "û": "u",
+       "　": " "}
+)
+
 def _normalize_text(s: str) -> str:
-    """Trim and NFKC-normalize text (folds full-width digits, etc.)."""
-    return unicodedata.normalize("NFKC", s.strip())
+    """Trim and fold text; run full NFKC only if non-ASCII remains."""
+    if s.isascii():  # common case: year=, date=, era=r — nothing to fold
+        return s.strip()
+    s2 = s.strip().translate(_FOLD)
+    return s2 if s2.isascii() else unicodedata.normalize("NFKC", s2)
 
+# Folds the common diacritics in one pass (after lowercasing) instead of
+# seven chained str.replace scans.
+_DIACRITIC_TABLE = str.maketrans({"ō": "o", "ū": "u", "â": "a", "ê": "e",
+                                  "î": "i", "ô": "o", "û": "u"})
+
+@lru_cache(maxsize=256)
 def _normalize_era_key(s: str) -> str:
     if s is None:
         return ""
-    s = _normalize_text(s)
-    low = s.lower()
-    # fold common diacritics
-    low = (low.replace("ō", "o").replace("ū", "u")
-              .replace("â", "a").replace("ê", "e")
-              .replace("î", "i").replace("ô", "o").replace("û", "u"))
-    return low
+    return _normalize_text(s).lower().translate(_DIACRITIC_TABLE)
+
+# Complete the alias table at import: every era's normalized English and
+# Japanese name maps to its code, so lookup never has to scan ERAS.
+for _era in ERAS:
+    ERA_ALIASES.setdefault(_normalize_era_key(_era.en), _era.code)
+    ERA_ALIASES.setdefault(_normalize_era_key(_era.ja), _era.code)
+ERA_BY_CODE = {e.code: e for e in ERAS}
 
+@lru_cache(maxsize=256)
 def _era_lookup(era_in: str):
-    """Find an era by code, romaji, or Japanese name."""
-    key = _normalize_era_key(era_in)
-    code = ERA_ALIASES.get(key)
-    if code:
-        return next(e for e in ERAS if e[0] == code)
-    for code_, en, ja, (y, m, d) in ERAS:
-        if _normalize_era_key(en) == key or _normalize_era_key(ja) == key:
-            return (code_, en, ja, (y, m, d))
-    return None
+    """Find an era by code, romaji, or Japanese name.
+
+    Cached: era inputs come from a small closed set of aliases, and ERAS
+    is immutable, so entries never need invalidation.
+    """
+    code = ERA_ALIASES.get(_normalize_era_key(era_in))
+    return ERA_BY_CODE.get(code) if code else None
+
+def _scan_era_year(t: str):
+    """
+    Single-pass parse of a normalized '<era><元|digits>[年]' string.
+    Handles both Japanese ('令和7年') and romaji ('Reiwa7') forms without
+    the regex engine: skip the era prefix, read the year, accept an
+    optional trailing 年. Returns (era_part, era_year) or None.
+    """
+    n = len(t)
+    i = 0
+    while i < n and t[i] != "元" and not t[i].isdigit():
+        i += 1
+    if i == 0 or i == n:
+        return None  # no era prefix, or no year at all
+    era_part = t[:i].rstrip()
+    if not era_part:
+        return None
+    if t[i] == "元":
+        era_year = 1
+        j = i + 1
+    else:
+        j = i
+        while j < n and t[j].isdigit():
+            j += 1
+        era_year = int(t[i:j])
+    while j < n and t[j].isspace():
+        j += 1
+    if j < n and t[j] == "年":
+        j += 1
+    while j < n and t[j].isspace():
+        j += 1
+    if j != n:
+        return None  # trailing garbage
+    return era_part, era_year
 
 def parse_era_year_text(text: str):
     """
@@ -65,61 +143,43 @@ def parse_era_year_text(text: str):
     if not text:
         raise ValueError("Empty input for era_year_text.")
     t = _normalize_text(text)
-
-    # Try Japanese form: <non-digit><(元|digits)><optional 年>
-    m = re.match(r"^([^\d0-9]+?)\s*(元|[0-9０-９]+)\s*年?\s*$", t)
-    if m:
-        era_part = m.group(1)
-        year_part = m.group(2)
-        if year_part == "元":
-            era_year = 1
-        else:
-            year_part = _normalize_text(year_part)  # fold full-width digits
-            era_year = int(year_part)
-        return era_part, era_year
-
-    # Try simple romaji form: Reiwa7 / Heisei31 / Showa64
-    m2 = re.match(r"^([A-Za-z]+)\s*([0-9０-９]+)\s*$", t)
-    if m2:
-        era_part = m2.group(1)
-        year_part = _normalize_text(m2.group(2))
-        era_year = int(year_part)
-        return era_part, era_year
-
-    raise ValueError(f"Cannot parse era_year_text: '{text}'")
+    parsed = _scan_era_year(t)
+    if parsed is None:
+        raise ValueError(f"Cannot parse era_year_text: '{text}'")
+    return parsed
 
 def from_western_year_only(year: int):
     """Convert by year (boundary year counts as new era)."""
     if year < MIN_YEAR:
         raise ValueError(f"Year must be >= {MIN_YEAR}.")
-    for code, en, ja, (sy, sm, sd) in ERAS:
-        if year >= sy:
-            return {
-                "era_en": en,
-                "era_ja": ja,
-                "era_year": year - sy + 1,
-                "year": year,
-                "method": "year-only",
-                "era_start_date": f"{sy:04d}-{sm:02d}-{sd:02d}"
-            }
-    raise ValueError("No matching era found.")
+    era = _ERAS_ASC[bisect.bisect_right(_ERA_START_YEARS, year) - 1]
+    return {
+        "era_en": era.en,
+        "era_ja": era.ja,
+        "era_year": year - era.start[0] + 1,
+        "year": year,
+        "method": "year-only",
+        "era_start_date": era.start_str
+    }
 
 def from_western_date(dt: date):
     """Date-accurate conversion (exact boundary days)."""
     if dt.year < MIN_YEAR:
         raise ValueError(f"Year must be >= {MIN_YEAR}.")
-    for code, en, ja, (sy, sm, sd) in ERAS:
-        if dt >= date(sy, sm, sd):
-            return {
-                "era_en": en,
-                "era_ja": ja,
-                "era_year": dt.year - sy + 1,
-                "year": dt.year,
-                "method": "date",
-                "era_start_date": f"{sy:04d}-{sm:02d}-{sd:02d}",
-                "date_used": dt.isoformat(),
-            }
-    raise ValueError("No matching era found.")
+    idx = bisect.bisect_right(_ERA_START_DATES, dt) - 1
+    if idx < 0:
+        # dt falls in 1868 but before the Meiji start date
+        raise ValueError("No matching era found.")
+    era = _ERAS_ASC[idx]
+    return {
+        "era_en": era.en,
+        "era_ja": era.ja,
+        "era_year": dt.year - era.start[0] + 1,
+        "year": dt.year,
+        "method": "date",
+        "era_start_date": era.start_str,
+        "date_used": dt.isoformat(),
+    }
 
 def to_western(era_input: str, era_year: int):
     """Convert Japanese era to Western year."""
@@ -128,104 +188,241 @@ def to_western(era_input: str, era_year: int):
     era = _era_lookup(era_input)
     if not era:
         raise ValueError(f"Unknown era '{era_input}'.")
-    code, en, ja, (sy, sm, sd) = era
-    western = sy + era_year - 1
+    western = era.start[0] + era_year - 1
     if western < MIN_YEAR:
         raise ValueError(f"Resulting year is < {MIN_YEAR}.")
     return {
-        "era_en": en,
-        "era_ja": ja,
+        "era_en": era.en,
+        "era_ja": era.ja,
         "era_year": era_year,
         "year": western,
         "method": "inverse",
-        "era_start_date": f"{sy:04d}-{sm:02d}-{sd:02d}"
+        "era_start_date": era.start_str
     }
 
+# Decimal strings for every year this service can realistically emit;
+# skips a str() call per response field.
+_YEAR_STR = [str(i) for i in range(2200)]
+
+def _int_str(n: int) -> str:
+    return _YEAR_STR[n] if 0 <= n < 2200 else str(n)
+
+# Era years are small bounded integers (closed eras have fixed maxima;
+# the current era gains one per year), so both label forms are precomputed
+# per (era_en, era_year). Pairs past the table — e.g. far-future era years
+# after a long process uptime — fall back to formatting on the fly.
+_MAX_ERA_YEAR = {"M": 45, "T": 15, "S": 64, "H": 31}
+_EN_LABEL = {}
+_JA_LABEL = {}
+for _era in ERAS:
+    for _y in range(1, _MAX_ERA_YEAR.get(_era.code, date.today().year - _era.start[0] + 2) + 1):
+        _EN_LABEL[(_era.en, _y)] = f"{_era.en} {_y}"
+        _JA_LABEL[(_era.en, _y)] = f"{_era.ja}{_y}年"
+
 def format_output(conv: dict, lang: str):
     """Format final output JSON for response (no AD/西暦, no era_code)."""
     lang = (lang or "en").lower()
-    era_label_en = f"{conv['era_en']} {conv['era_year']}"
-    era_label_ja = f"{conv['era_ja']}{conv['era_year']}年"
-    western_text = str(conv["year"])  # always plain digits
+    label_key = (conv["era_en"], conv["era_year"])
+    era_label_en = _EN_LABEL.get(label_key)
+    if era_label_en is not None:
+        era_label_ja = _JA_LABEL[label_key]
+    else:
+        era_year_str = _int_str(conv["era_year"])
+        era_label_en = conv["era_en"] + " " + era_year_str
+        era_label_ja = conv["era_ja"] + era_year_str + "年"
+    western_text = _int_str(conv["year"])  # always plain digits
 
-    result = {
+    # The schema is fixed apart from date_used (date conversions only), so
+    # emit a single dict literal per branch instead of conditional inserts.
+    if "date_used" in conv:
+        return {
+            "western_text": western_text,
+            "japanese_text": era_label_ja if lang == "ja" else era_label_en,
+            "era_en": conv["era_en"],
+            "era_ja": conv["era_ja"],
+            "era_year": conv["era_year"],
+            "year": conv["year"],
+            "date_used": conv["date_used"],
+            "era_start_date": conv["era_start_date"],
+            "method": conv["method"],
+        }
+    return {
         "western_text": western_text,
         "japanese_text": era_label_ja if lang == "ja" else era_label_en,
         "era_en": conv["era_en"],
         "era_ja": conv["era_ja"],
         "era_year": conv["era_year"],
         "year": conv["year"],
+        "era_start_date": conv["era_start_date"],
+        "method": conv["method"],
     }
-    if "date_used" in conv:
-        result["date_used"] = conv["date_used"]
-    if "era_start_date" in conv:
-        result["era_start_date"] = conv["era_start_date"]
-    if "method" in conv:
-        result["method"] = conv["method"]
-    return result
 
-@app.route("/convert", methods=["GET", "POST"])
-def convert():
-    """
-    Inputs (GET or JSON):
-      A) Western → Era:
-         - year=<int> (>=1868)            [year-only; boundary year => new era]
-         - OR date=YYYY-MM-DD             [date-accurate across boundary days]
-         - OR now=true                    [use server's current date]
-      B) Era → Western:
-         - era=<code/romaji/kanji/kana>   (e.g., R, reiwa, 令和, れいわ)
-         - era_year=<int >=1>
-         - OR era_year_text=<combined>    (e.g., 令和7年, 平成元年, Reiwa7)
+# Responses for year-only and era→western conversions are deterministic in
+# their arguments, so cache the serialized bytes. Failed conversions raise
+# ValueError and are never cached.
+@lru_cache(maxsize=4096)
+def _cached_year_only_body(year: int, lang: str) -> bytes:
+    return rest_response_body(format_output(from_western_year_only(year), lang))
 
-      Optional:
-         - lang=en|ja (default en)
+@lru_cache(maxsize=4096)
+def _cached_inverse_body(era: str, era_year: int, lang: str) -> bytes:
+    return rest_response_body(format_output(to_western(era, era_year), lang))
+
+# now=true is constant within a calendar day: cache the serialized body per
+# (day ordinal, lang) and drop all entries when the date rolls over. The
+# lang key is normalized to the two values format_output distinguishes, so
+# the cache never exceeds two entries per day regardless of input.
+_TODAY_CACHE: dict = {}
+
+def _today_body(today: date, lang) -> bytes:
+    lang = "ja" if str(lang).lower() == "ja" else "en"
+    key = (today.toordinal(), lang)
+    body = _TODAY_CACHE.get(key)
+    if body is None:
+        if _TODAY_CACHE and next(iter(_TODAY_CACHE))[0] != key[0]:
+            _TODAY_CACHE.clear()  # new day: yesterday's entries are stale
+        body = rest_response_body(format_output(from_western_date(today), lang))
+        _TODAY_CACHE[key] = body
+    return body
+
+def _convert(data):
+    """Run a conversion from a plain mapping of request parameters.
+
+    Shared by the Flask view and the WSGI fast path below; must not touch
+    the Flask request object.
     """
     try:
-        data = request.get_json(silent=True) or (request.args or {})
-        lang = data.get("lang", "en")
+        get = data.get  # bound once; works for dict and MultiDict alike
+        lang = get("lang", "en")
 
         # 0) Combined Japanese-style input: '令和7年', '平成元年', 'Reiwa7'
-        if data.get("era_year_text"):
+        era_year_text = get("era_year_text")
+        if era_year_text:
             try:
-                era_part, era_year = parse_era_year_text(data.get("era_year_text"))
-                return rest_response(format_output(to_western(era_part, era_year), lang))
+                era_part, era_year = parse_era_year_text(era_year_text)
+                return rest_prepared(_cached_inverse_body(era_part, era_year, lang))
             except ValueError as e:
                 return rest_error(str(e))
 
         # 1) Current date
-        if str(data.get("now", "")).lower() in ("true", "1", "yes"):
-            dt = date.today()
-            return rest_response(format_output(from_western_date(dt), lang))
+        if str(get("now", "")).lower() in ("true", "1", "yes"):
+            return rest_prepared(_today_body(date.today(), lang))
 
         # 2) Specific date
-        if data.get("date"):
+        date_text = get("date")
+        if date_text:
             try:
-                dt = datetime.strptime(data.get("date"), "%Y-%m-%d").date()
+                dt = date.fromisoformat(date_text)
             except ValueError:
                 return rest_error("Invalid 'date'. Use YYYY-MM-DD.")
             return rest_response(format_output(from_western_date(dt), lang))
 
         # 3) Year or Era-based conversion
-        year = data.get("year")
-        era = data.get("era")
-        era_year = data.get("era_year")
+        year = get("year")
+        era = get("era")
+        era_year = get("era_year")
 
         year = int(year) if (year not in (None, "")) else None
         era_year = int(era_year) if (era_year not in (None, "")) else None
 
         if year is not None and (era is None and era_year is None):
-            conv = from_western_year_only(year)
+            return rest_prepared(_cached_year_only_body(year, lang))
         elif (era is not None) and (era_year is not None) and (year is None):
-            conv = to_western(era, era_year)
+            return rest_prepared(_cached_inverse_body(era, era_year, lang))
         else:
             return rest_error("Provide either year/date/now OR (era and era_year) OR era_year_text, but not both.")
 
-        return rest_response(format_output(conv, lang))
-
     except ValueError as e:
         return rest_error(str(e))
     except Exception as e:
         return rest_error(f"Internal server error: {e}")
 
+@app.route("/convert", methods=["GET", "POST"])
+def convert():
+    """
+    Inputs (GET or JSON):
+      A) Western → Era:
+         - year=<int> (>=1868)            [year-only; boundary year => new era]
+         - OR date=YYYY-MM-DD             [date-accurate across boundary days]
+         - OR now=true                    [use server's current date]
+      B) Era → Western:
+         - era=<code/romaji/kanji/kana>   (e.g., R, reiwa, 令和, れいわ)
+         - era_year=<int >=1>
+         - OR era_year_text=<combined>    (e.g., 令和7年, 平成元年, Reiwa7)
+
+      Optional:
+         - lang=en|ja (default en)
+    """
+    # GET/HEAD never carry JSON here: read request.args directly (no body
+    # parse attempt, no MultiDict copy); only POST is a JSON body.
+    if request.method != "POST":
+        data = request.args
+    else:
+        data = request.get_json(silent=True) or {}
+    return _convert(data)
+
+@app.route("/convert/batch", methods=["POST"])
+def convert_batch():
+    """
+    Convert many Western years in one request.
+    Body (JSON): {"years": [<int>, ...], "lang": "en"|"ja"}
+    Returns a result list in input order, one entry per year, in the same
+    shape as the single year-only conversion.
+    """
+    payload = request.get_json(silent=True) or {}
+    years = payload.get("years")
+    if not isinstance(years, list) or not years:
+        return rest_error("Provide a non-empty 'years' list.")
+    # Strict element check: rejects nested lists, floats, numeric strings
+    # and bools up front, so the array below is always 1-D int32.
+    if not all(type(y) is int for y in years):
+        return rest_error("'years' must be a list of integers.")
+    lang = str(payload.get("lang", "en")).lower()
+    try:
+        years_arr = np.asarray(years, dtype=np.int32)
+    except OverflowError:
+        return rest_error("'years' must be a list of integers.")
+    if (years_arr < MIN_YEAR).any():
+        return rest_error(f"Year must be >= {MIN_YEAR}.")
+    # Vectorized era selection: one searchsorted over all years instead of
+    # a Python-level lookup per year.
+    idx = np.searchsorted(_ERA_START_YEARS_NP, years_arr, side="right") - 1
+    era_years = years_arr - _ERA_START_YEARS_NP[idx] + 1
+    results = []
+    for year, i, era_year in zip(years_arr.tolist(), idx.tolist(), era_years.tolist()):
+        era = _ERAS_ASC[i]
+        results.append({
+            "western_text": str(year),
+            "japanese_text": f"{era.ja}{era_year}年" if lang == "ja" else f"{era.en} {era_year}",
+            "era_en": era.en,
+            "era_ja": era.ja,
+            "era_year": era_year,
+            "year": year,
+            "era_start_date": era.start_str,
+            "method": "year-only",
+        })
+    return rest_response(results)
+
+# Fast path: serve GET /convert straight from WSGI, skipping Flask's URL
+# routing and request-context setup. The business logic is microseconds of
+# work, so framework dispatch dominates per-request time otherwise.
+# Everything else (POST bodies, other paths, 404s) falls through to Flask.
+_flask_wsgi = app.wsgi_app
+
+def _wsgi_dispatch(environ, start_response):
+    if environ.get("REQUEST_METHOD") in ("GET", "HEAD") and environ.get("PATH_INFO") == "/convert":
+        # PEP 3333 hands over the query string latin-1-decoded; recode to
+        # UTF-8 the same way Werkzeug does before parsing. Keep blank
+        # values and let the first occurrence of a duplicate key win, to
+        # match MultiDict.get semantics on the Flask path.
+        qs = environ.get("QUERY_STRING", "").encode("latin-1").decode("utf-8", "replace")
+        data = {}
+        for k, v in parse_qsl(qs, keep_blank_values=True):
+            data.setdefault(k, v)
+        return _convert(data)(environ, start_response)
+    return _flask_wsgi(environ, start_response)
+
+app.wsgi_app = _wsgi_dispatch  # type: ignore[method-assign]
+
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=8080, debug=False)
@@ -1,13 +1,42 @@
-from flask import jsonify
+import orjson
+from flask import Response
 
 def rest_response(obj):
-    return jsonify({
+    return Response(orjson.dumps({
+        "status": "OK",
+        "result": obj
+    }), mimetype="application/json")
+
+def rest_response_body(obj) -> bytes:
+    """Serialize a success envelope to bytes, for caching at call sites."""
+    return orjson.dumps({
         "status": "OK",
         "result": obj
     })
 
-def rest_error(message: str):
-    return jsonify({
+def rest_prepared(body: bytes):
+    """Wrap an already-serialized envelope in a Response."""
+    return Response(body, mimetype="application/json")
+
+def _error_response(message: str):
+    return Response(orjson.dumps({
         "status": "ERROR",
         "result": message
-    }), 400
+    }), status=400, mimetype="application/json")
+
+# Common misuse produces a small fixed set of error messages (invalid
+# dates especially, under adversarial traffic). Their responses are built
+# once here and reused; a Response is never mutated after construction,
+# so returning the same object each time is safe.
+_ERROR_RESP = {msg: _error_response(msg) for msg in (
+    "Invalid 'date'. Use YYYY-MM-DD.",
+    "Empty input for era_year_text.",
+    "Era year must be >= 1.",
+    "Year must be >= 1868.",
+    "Provide either year/date/now OR (era and era_year) OR era_year_text, but not both.",
+    "Provide a non-empty 'years' list.",
+    "'years' must be a list of integers.",
+)}
+
+def rest_error(message: str):
+    return _ERROR_RESP.get(message) or _error_response(message)